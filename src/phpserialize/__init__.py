@@ -260,10 +260,10 @@ r"""
 """
 from typing import (
     Any, Dict, List, Tuple, Optional, Union, Callable, Protocol,
-    TypeVar, Iterable, cast
+    TypeVar, Iterable, Literal, cast, overload
 )
 import codecs
-from io import BytesIO
+from functools import lru_cache
 
 try:
     codecs.lookup_error('surrogateescape')
@@ -300,20 +300,54 @@ class SupportsWrite(Protocol):
     def write(self, s: bytes, /) -> int: ...
 
 
+# Number of bytes read at once by `load` from seekable streams.
+_STREAM_CHUNK_SIZE = 8192
+
+# Precomputed values of the integer tokens that make up most of a dump:
+# array sizes and indices, string lengths and booleans.  A dict lookup is
+# considerably cheaper than parsing them with `int`.
+_SMALL_INTS: Dict[bytes, int] = {str(i).encode('ascii'): i for i in range(-1, 1024)}
+
+# Codecs that `bytes.decode` resolves without a registry lookup.  For these
+# calling the method is faster than a cached decoder function.
+_BUILTIN_DECODE_CODECS = frozenset(['utf-8', 'ascii', 'iso8859-1', 'utf-16', 'utf-32'])
+
+
+def _get_decoder(charset: str) -> Optional[Callable[[bytes, str], Tuple[str, int]]]:
+    """Return a decoder function for `charset` or `None` if `bytes.decode`
+    handles the charset without a codec lookup anyways.  Codecs that are
+    not text encodings (base64, rot13, ...) are left to `bytes.decode` as
+    well so that they fail with its `LookupError`.
+    """
+    info = codecs.lookup(charset)
+    if info.name in _BUILTIN_DECODE_CODECS or not info._is_text_encoding:
+        return None
+    return info.decode
+
+
 # Type for object hooks
 ObjectHookLoad = Callable[[Union[str, bytes], PHPDict], Any]
+ObjectItemsHookLoad = Callable[[Union[str, bytes], PHPArray], Any]
+ObjectHookStyle = Literal['dict', 'items']
 ObjectHookDump = Callable[[Any], 'phpobject']
 ArrayHook = Callable[[PHPArray], Any]
 
+# Type of the output callback used by the serializer
+_Write = Callable[[bytes], Any]
+
+# Serialized booleans
+_TRUE = b'b:1;'
+_FALSE = b'b:0;'
+
 
 def _translate_member_name(name: Union[str, int, bytes]) -> Union[str, int, bytes]:
     """Translate PHP member names to Python identifiers."""
+    # the member name is what follows the last separator; partitioning
+    # does not build the intermediate list that split would
     if isinstance(name, str) and name.startswith(' '):
-        name = name.split(None, 2)[-1]
+        name = name.rpartition(' ')[2]
     elif isinstance(name, bytes) and name.startswith(b' '):
-        parts = name.split(None, 2)
-        if len(parts) > 0:
-            name = parts[-1]
+        name = name.rpartition(b' ')[2]
     return name
 
 
@@ -334,9 +368,16 @@ class phpobject:
         return convert_member_dict(self.__php_vars__)
 
     def _lookup_php_var(self, name: str) -> Optional[Tuple[Union[str, int, bytes], Any]]:
-        for key, value in self.__php_vars__.items():
-            if _translate_member_name(key) == name:
-                return key, value
+        php_vars = self.__php_vars__
+        # members are matched in dict order.  Public members are stored
+        # under their plain name and a protected or private member key
+        # ends in ' <name>'; checking that in C skips translating the keys
+        # that cannot match
+        suffix = ' ' + name
+        for key, value in php_vars.items():
+            if key == name or isinstance(key, str) and key.endswith(suffix):
+                if _translate_member_name(key) == name:
+                    return key, value
         return None
 
     def __getattr__(self, name: str) -> Any:
@@ -371,7 +412,19 @@ def convert_member_dict(d: PHPDict) -> PHPDict:
     return {_translate_member_name(k): v for k, v in d.items()}
 
 
+@lru_cache(maxsize=256)
+def _object_header(name: bytes) -> bytes:
+    """Return the ``O:<length>:"<name>":`` header for a class name.  Dumps
+    usually contain many objects of the same few classes.
+    """
+    return b'O:%d:"%s":' % (len(name), name)
+
+
 class _PHPSerializer:
+    """Serializer that appends the output fragments to a list through its
+    bound `append` method and joins them once at the end.
+    """
+
     def __init__(
         self,
         charset: str,
@@ -387,64 +440,89 @@ class _PHPSerializer:
             return obj.encode(self.charset, self.errors)
         return obj
 
-    def _serialize_string(self, encoded: bytes) -> bytes:
-        s = BytesIO()
-        s.write(b's:')
-        s.write(str(len(encoded)).encode('latin1'))
-        s.write(b':"')
-        s.write(encoded)
-        s.write(b'";')
-        return s.getvalue()
+    def _serialize_string(self, encoded: bytes, write: _Write) -> None:
+        write(b's:%d:"' % len(encoded))
+        write(encoded)
+        write(b'";')
 
-    def _serialize_key(self, obj: Any) -> bytes:
+    def _serialize_key(self, obj: Any, write: _Write) -> None:
         if isinstance(obj, (int, float, bool)):
-            return ('i:%i;' % obj).encode('latin1')
-        if isinstance(obj, (bytes, str)):
-            return self._serialize_string(self._encode_bytes(obj))
-        if obj is None:
-            return b's:0:"";'
-        raise TypeError('can\'t serialize %r as key' % type(obj))
-
-    def _serialize_array(self, iterable: Iterable[Tuple[Any, Any]], length: int) -> bytes:
-        out: List[bytes] = []
-        for key, value in iterable:
-            out.append(self._serialize_key(key))
-            out.append(self._serialize_value(value))
-        return b''.join([
-            b'a:',
-            str(length).encode('latin1'),
-            b':{',
-            b''.join(out),
-            b'}'
-        ])
-
-    def _serialize_value(self, obj: Any) -> bytes:
-        if obj is None:
-            return b'N;'
-        if isinstance(obj, bool):
-            return ('b:%i;' % obj).encode('latin1')
-        if isinstance(obj, int):
-            return ('i:%s;' % obj).encode('latin1')
-        if isinstance(obj, float):
-            return ('d:%s;' % obj).encode('latin1')
-        if isinstance(obj, (bytes, str)):
-            return self._serialize_string(self._encode_bytes(obj))
+            write(b'i:%d;' % obj)
+        elif isinstance(obj, (bytes, str)):
+            self._serialize_string(self._encode_bytes(obj), write)
+        elif obj is None:
+            write(b's:0:"";')
+        else:
+            raise TypeError('can\'t serialize %r as key' % type(obj))
+
+    def _serialize_none(self, obj: None, write: _Write) -> None:
+        write(b'N;')
+
+    def _serialize_bool(self, obj: bool, write: _Write) -> None:
+        write(_TRUE if obj else _FALSE)
+
+    def _serialize_int(self, obj: int, write: _Write) -> None:
+        write(b'i:%d;' % obj)
+
+    def _serialize_float(self, obj: float, write: _Write) -> None:
+        write(b'd:%r;' % float(obj))
+
+    def _serialize_text(self, obj: Union[str, bytes], write: _Write) -> None:
+        self._serialize_string(self._encode_bytes(obj), write)
+
+    def _serialize_array(self, obj: Union[Dict[Any, Any], List[Any], Tuple[Any, ...]],
+                         write: _Write, prefix: bytes = b'a:') -> None:
+        # loops here rather than in a helper so that nesting costs only
+        # this frame and the one of `_serialize_value`
+        items: Iterable[Tuple[Any, Any]]
         if isinstance(obj, dict):
-            obj_dict = cast(Dict[Any, Any], obj)
-            return self._serialize_array(obj_dict.items(), len(obj_dict))
-        if isinstance(obj, (list, tuple)):
-            obj_seq = cast(Union[List[Any], Tuple[Any, ...]], obj)
-            return self._serialize_array(enumerate(obj_seq), len(obj_seq))
-        if isinstance(obj, phpobject):
-            name_part = self._serialize_key(obj.__name__)[1:-1]
-            vars_part = self._serialize_value(obj.__php_vars__)[1:]
-            return b'O' + name_part + vars_part
-        if self.object_hook is not None:
-            return self._serialize_value(self.object_hook(obj))
-        raise TypeError('can\'t serialize %r' % type(obj))
+            items = obj.items()
+        else:
+            items = enumerate(obj)
+        write(b'%s%d:{' % (prefix, len(obj)))
+        for key, value in items:
+            self._serialize_key(key, write)
+            self._serialize_value(value, write)
+        write(b'}')
+
+    def _serialize_phpobject(self, obj: 'phpobject', write: _Write) -> None:
+        self._serialize_array(obj.__php_vars__, write,
+                              _object_header(self._encode_bytes(obj.__name__)))
+
+    # exact type -> handler, in the order subclasses are matched by
+    # `_find_handler` (bool before int)
+    _dispatch: Dict[type, Callable[['_PHPSerializer', Any, _Write], None]] = {
+        type(None): _serialize_none,
+        bool: _serialize_bool,
+        int: _serialize_int,
+        float: _serialize_float,
+        str: _serialize_text,
+        bytes: _serialize_text,
+        dict: _serialize_array,
+        list: _serialize_array,
+        tuple: _serialize_array,
+        phpobject: _serialize_phpobject,
+    }
+
+    def _find_handler(self, obj: Any) -> Optional[Callable[['_PHPSerializer', Any, _Write], None]]:
+        for type_, handler in self._dispatch.items():
+            if isinstance(obj, type_):
+                return handler
+        return None
+
+    def _serialize_value(self, obj: Any, write: _Write) -> None:
+        handler = self._dispatch.get(type(obj)) or self._find_handler(obj)
+        if handler is not None:
+            handler(self, obj, write)
+        elif self.object_hook is not None:
+            self._serialize_value(self.object_hook(obj), write)
+        else:
+            raise TypeError('can\'t serialize %r' % type(obj))
 
     def dumps(self, data: PHPValue) -> bytes:
-        return self._serialize_value(data)
+        parts: List[bytes] = []
+        self._serialize_value(data, parts.append)
+        return b''.join(parts)
 
 
 def dumps(
@@ -462,103 +540,299 @@ def dumps(
 
 
 class _PHPUnserializer:
+    """Unserializer working on an in-memory buffer.  Instead of reading
+    the input byte by byte through a file-like object, tokens are located
+    with `bytes.find` and sliced out of the buffer by offset.  Running out
+    of data calls `_fill` which subclasses can implement to pull in more.
+    """
+
     def __init__(
         self,
-        fp: SupportsRead,
+        data: bytes,
         charset: str,
         errors: str,
         decode_strings: bool,
-        object_hook: Optional[ObjectHookLoad],
-        array_hook: Optional[ArrayHook]
+        object_hook: Optional[Union[ObjectHookLoad, ObjectItemsHookLoad]],
+        array_hook: Optional[ArrayHook],
+        object_hook_style: ObjectHookStyle = 'dict'
     ) -> None:
-        self.fp = fp
+        if object_hook_style not in ('dict', 'items'):
+            raise ValueError('unknown object_hook_style %r' % (object_hook_style,))
+        if type(data) is not bytes:
+            # memoryview rejects ints and str, which bytes() would turn
+            # into a zero-filled buffer or fail on with a misleading error
+            data = bytes(memoryview(data))
+        self.data = data
+        self.pos = 0
         self.charset = charset
         self.errors = errors
+        # resolved by `_decode` when the first string is decoded
+        self.decoder: Optional[Callable[[bytes, str], Tuple[str, int]]] = None
+        self.decoder_resolved = False
         self.decode_strings = decode_strings
         self.object_hook = object_hook
+        self.object_hook_style = object_hook_style
         self.array_hook = cast(ArrayHook, array_hook or dict)
+        self.keys: Dict[str, str] = {}
 
     def load(self) -> Any:
         return self._unserialize()
 
+    def _fill(self, size: int) -> None:
+        """Make at least `size` more bytes available after the end of the
+        buffer.  This may drop the already consumed part of the buffer and
+        move `pos` accordingly.
+        """
+        raise ValueError('unexpected end of stream')
+
+    def _read(self, length: int) -> bytes:
+        if length < 0:
+            raise ValueError('negative length %d' % length)
+        while self.pos + length > len(self.data):
+            self._fill(self.pos + length - len(self.data))
+        pos = self.pos
+        end = pos + length
+        self.pos = end
+        return self.data[pos:end]
+
     def _expect(self, expected: bytes) -> None:
-        value = self.fp.read(len(expected))
+        pos = self.pos
+        end = pos + len(expected)
+        value = self.data[pos:end]
         if value != expected:
+            if end > len(self.data):
+                self._fill(end - len(self.data))
+                return self._expect(expected)
             raise ValueError('failed expectation, expected %r got %r' % (expected, value))
+        self.pos = end
 
     def _read_until(self, delim: bytes) -> bytes:
-        buf: List[bytes] = []
-        while True:
-            char = self.fp.read(1)
-            if char == delim:
-                break
-            if not char:
-                raise ValueError('unexpected end of stream')
-            buf.append(char)
-        return b''.join(buf)
+        pos = self.pos
+        end = self.data.find(delim, pos)
+        while end < 0:
+            searched = len(self.data) - pos
+            self._fill(1)
+            pos = self.pos
+            end = self.data.find(delim, pos + searched)
+        self.pos = end + 1
+        return self.data[pos:end]
+
+    def _read_field(self, delim: bytes) -> bytes:
+        """Read a `:<value><delim>` field.  The common case locates the
+        delimiter with one `bytes.find` and checks the colon in place.
+        """
+        data = self.data
+        pos = self.pos
+        end = data.find(delim, pos + 1)
+        if end >= 0 and data[pos] == 0x3a:
+            self.pos = end + 1
+            return data[pos + 1:end]
+        self._expect(b':')
+        return self._read_until(delim)
 
     def _read_string(self) -> Union[str, bytes]:
-        self._expect(b':')
-        length = int(self._read_until(b':'))
-        self._expect(b'"')
-        data_bytes = self.fp.read(length)
-        self._expect(b'"')
-        self._expect(b';')
+        token = self._read_field(b':')
+        length = _SMALL_INTS.get(token)
+        if length is None:
+            length = int(token)
+        if length < 0:
+            raise ValueError('negative string length %d' % length)
+        while self.pos + length + 3 > len(self.data):
+            self._fill(self.pos + length + 3 - len(self.data))
+        data = self.data
+        start = self.pos + 1
+        end = start + length
+        if data[start - 1] != 0x22 or data[end:end + 2] != b'";':
+            raise ValueError('malformed string at offset %d' % (start - 1))
+        self.pos = end + 2
+        # decode straight from the buffer slice without going through _read
         if self.decode_strings:
-            return data_bytes.decode(self.charset, self.errors)
-        return data_bytes
-
-    def _load_array(self) -> PHPArray:
-        items = int(self._read_until(b':')) * 2
+            return self._decode(data[start:end])
+        return data[start:end]
+
+    def _decode(self, value: bytes) -> str:
+        if not self.decoder_resolved:
+            self.decoder = _get_decoder(self.charset)
+            self.decoder_resolved = True
+        if self.decoder is None:
+            return value.decode(self.charset, self.errors)
+        return self.decoder(value, self.errors)[0]
+
+    def _read_array_size(self) -> int:
+        token = self._read_field(b':')
+        items = _SMALL_INTS.get(token)
+        if items is None:
+            items = int(token)
         self._expect(b'{')
-        result: PHPArray = []
-        missing = object()
-        last_item: Any = missing
-        for _ in range(items):
-            item = self._unserialize()
-            if last_item is missing:
-                last_item = item
-            else:
-                result.append((last_item, item))
-                last_item = missing
+        return items
+
+    def _read_key(self) -> Any:
+        key = self._unserialize()
+        # decoded string keys repeat across arrays of the same shape, so
+        # equal keys share one object for the lifetime of the unserializer
+        if type(key) is str:
+            key = self.keys.setdefault(key, key)
+        return key
+
+    def _load_array(self, hook: Optional[ArrayHook] = None) -> Any:
+        """Load the `:<size>:{...}` body of an array or object and call
+        `hook` with its list of pairs.  `hook` defaults to the array hook.
+        For `dict` the result is filled directly without building the
+        pairs first.  This is also the handler of the array opcode, so
+        nesting costs only this frame and the one of `_unserialize`.
+        """
+        if hook is None:
+            hook = self.array_hook
+        items = self._read_array_size()
+        key: PHPKey
+        if hook is not dict:
+            pairs: PHPArray = []
+            for _ in range(items):
+                key = self._read_key()
+                pairs.append((key, self._unserialize()))
+            self._expect(b'}')
+            # a list of the pairs is the pairs themselves
+            return pairs if hook is list else hook(pairs)
+        unserialize = self._unserialize
+        result: PHPDict = {}
+        if self.data.startswith(b'i:', self.pos):
+            # arrays starting with an integer key, which covers every PHP
+            # list: parse integer keys in place instead of dispatching
+            for _ in range(items):
+                data = self.data
+                pos = self.pos
+                end = data.find(b';', pos + 2) if data.startswith(b'i:', pos) else -1
+                if end >= 0:
+                    self.pos = end + 1
+                    token = data[pos + 2:end]
+                    int_key = _SMALL_INTS.get(token)
+                    key = int(token) if int_key is None else int_key
+                else:
+                    key = self._read_key()
+                result[key] = unserialize()
+        else:
+            for _ in range(items):
+                key = self._read_key()
+                result[key] = unserialize()
         self._expect(b'}')
         return result
 
     def _load_object(self) -> Any:
         if self.object_hook is None:
             raise ValueError('object in serialization dump but object_hook not given.')
-        self._expect(b':')
-        name_length = int(self._read_until(b':'))
+        name_length = int(self._read_field(b':'))
+        self._expect(b'"')
+        name_bytes = self._read(name_length)
         self._expect(b'"')
-        name_bytes = self.fp.read(name_length)
-        self._expect(b'":')
         if self.decode_strings:
-            name: Union[bytes, str] = name_bytes.decode(self.charset, self.errors)
+            name: Union[bytes, str] = self._decode(name_bytes)
         else:
             name = name_bytes
-        return self.object_hook(name, dict(self._load_array()))
+        if self.object_hook_style == 'items':
+            return cast(ObjectItemsHookLoad, self.object_hook)(name, self._load_array(list))
+        return cast(ObjectHookLoad, self.object_hook)(name, self._load_array(dict))
+
+    def _unserialize_null(self) -> None:
+        self._expect(b';')
+        return None
+
+    def _unserialize_int(self) -> int:
+        token = self._read_field(b';')
+        value = _SMALL_INTS.get(token)
+        if value is None:
+            value = int(token)
+        return value
+
+    def _unserialize_bool(self) -> bool:
+        return self._unserialize_int() != 0
+
+    def _unserialize_float(self) -> float:
+        return float(self._read_field(b';'))
+
+    # opcode -> handler; opcodes are matched case-insensitively
+    _dispatch: Dict[bytes, Callable[['_PHPUnserializer'], Any]] = {
+        b'N': _unserialize_null,
+        b'i': _unserialize_int,
+        b'b': _unserialize_bool,
+        b'd': _unserialize_float,
+        b's': _read_string,
+        b'a': _load_array,
+        b'O': _load_object,
+    }
+    _dispatch.update([(k.swapcase(), v) for k, v in list(_dispatch.items())])
 
     def _unserialize(self) -> Any:
-        type_ = self.fp.read(1).lower()
-        if type_ == b'n':
-            self._expect(b';')
-            return None
-        if type_ in b'idb':
-            self._expect(b':')
-            data = self._read_until(b';')
-            if type_ == b'i':
-                return int(data)
-            if type_ == b'd':
-                return float(data)
-            return int(data) != 0
-        if type_ == b's':
-            return self._read_string()
-        if type_ == b'a':
-            self._expect(b':')
-            return self.array_hook(self._load_array())
-        if type_ == b'o':
-            return self._load_object()
-        raise ValueError('unexpected opcode')
+        handler = self._dispatch.get(self._read(1))
+        if handler is None:
+            raise ValueError('unexpected opcode')
+        return handler(self)
+
+
+class _PHPStreamUnserializer(_PHPUnserializer):
+    """Unserializer that pulls its buffer from a file-like object.  For
+    seekable streams data is read in chunks and the stream is rewound to
+    the end of the object afterwards so that chained objects can be read.
+    Other streams are only read as far as needed to not overshoot.
+    """
+
+    def __init__(
+        self,
+        fp: SupportsRead,
+        charset: str,
+        errors: str,
+        decode_strings: bool,
+        object_hook: Optional[Union[ObjectHookLoad, ObjectItemsHookLoad]],
+        array_hook: Optional[ArrayHook],
+        object_hook_style: ObjectHookStyle = 'dict'
+    ) -> None:
+        _PHPUnserializer.__init__(self, b'', charset, errors, decode_strings,
+                                  object_hook, array_hook, object_hook_style)
+        self.fp = fp
+        seekable = getattr(fp, 'seekable', None)
+        self.seekable = bool(seekable is not None and seekable())
+        # stream position of the start of the buffer
+        self.offset = cast(Any, fp).tell() if self.seekable else 0
+
+    def load(self) -> Any:
+        rv = self._unserialize()
+        if self.seekable:
+            cast(Any, self.fp).seek(self.offset + self.pos)
+        return rv
+
+    def _fill(self, size: int) -> None:
+        if self.seekable:
+            size = max(size, _STREAM_CHUNK_SIZE, len(self.data) - self.pos)
+        chunk = self.fp.read(size)
+        if not chunk:
+            raise ValueError('unexpected end of stream')
+        self.offset += self.pos
+        self.data = self.data[self.pos:] + chunk
+        self.pos = 0
+
+
+@overload
+def load(
+    fp: SupportsRead,
+    charset: str = ...,
+    errors: str = ...,
+    decode_strings: bool = ...,
+    object_hook: Optional[ObjectHookLoad] = ...,
+    array_hook: Optional[ArrayHook] = ...,
+    object_hook_style: Literal['dict'] = ...
+) -> Any: ...
+
+
+@overload
+def load(
+    fp: SupportsRead,
+    charset: str = ...,
+    errors: str = ...,
+    decode_strings: bool = ...,
+    object_hook: Optional[ObjectItemsHookLoad] = ...,
+    array_hook: Optional[ArrayHook] = ...,
+    *,
+    object_hook_style: Literal['items']
+) -> Any: ...
 
 
 def load(
@@ -566,8 +840,9 @@ def load(
     charset: str = 'utf-8',
     errors: str = default_errors,
     decode_strings: bool = False,
-    object_hook: Optional[ObjectHookLoad] = None,
-    array_hook: Optional[ArrayHook] = None
+    object_hook: Optional[Union[ObjectHookLoad, ObjectItemsHookLoad]] = None,
+    array_hook: Optional[ArrayHook] = None,
+    object_hook_style: ObjectHookStyle = 'dict'
 ) -> Any:
     """Read a string from the open file object `fp` and interpret it as a
     data stream of PHP-serialized objects, reconstructing and returning
@@ -579,7 +854,8 @@ def load(
     object that meets this interface.
 
     `load` will read exactly one object from the stream.  See the docstring of
-    the module for this chained behavior.
+    the module for this chained behavior.  If `fp` is seekable it is read in
+    chunks and rewound to the end of the object afterwards.
 
     If an object hook is given object-opcodes are supported in the serilization
     format.  The function is called with the class name and a dict of the
@@ -587,28 +863,63 @@ def load(
     usually not what you want.  The `simple_object_hook` function can convert
     them to Python identifier names.
 
+    If `object_hook_style` is ``'items'`` the object hook is called with a
+    list of ``(key, value)`` pairs instead of the dict, the same way an
+    `array_hook` is.  This saves building a dict for hooks that only pick
+    out a few members.
+
     If an `array_hook` is given that function is called with a list of pairs
     for all array items.  This can for example be set to
     `collections.OrderedDict` for an ordered, hashed dictionary.
     """
-    unserializer = _PHPUnserializer(fp, charset, errors, decode_strings, object_hook, array_hook)
+    unserializer = _PHPStreamUnserializer(fp, charset, errors, decode_strings, object_hook,
+                                          array_hook, object_hook_style)
     return unserializer.load()
 
 
+@overload
+def loads(
+    data: bytes,
+    charset: str = ...,
+    errors: str = ...,
+    decode_strings: bool = ...,
+    object_hook: Optional[ObjectHookLoad] = ...,
+    array_hook: Optional[ArrayHook] = ...,
+    object_hook_style: Literal['dict'] = ...
+) -> Any: ...
+
+
+@overload
+def loads(
+    data: bytes,
+    charset: str = ...,
+    errors: str = ...,
+    decode_strings: bool = ...,
+    object_hook: Optional[ObjectItemsHookLoad] = ...,
+    array_hook: Optional[ArrayHook] = ...,
+    *,
+    object_hook_style: Literal['items']
+) -> Any: ...
+
+
 def loads(
     data: bytes,
     charset: str = 'utf-8',
     errors: str = default_errors,
     decode_strings: bool = False,
-    object_hook: Optional[ObjectHookLoad] = None,
-    array_hook: Optional[ArrayHook] = None
+    object_hook: Optional[Union[ObjectHookLoad, ObjectItemsHookLoad]] = None,
+    array_hook: Optional[ArrayHook] = None,
+    object_hook_style: ObjectHookStyle = 'dict'
 ) -> Any:
     """Read a PHP-serialized object hierarchy from a string.  Characters in the
     string past the object's representation are ignored.  On Python 3 the
     string must be a bytestring.
+
+    The hooks and `object_hook_style` work as described for `load`.
     """
-    return load(BytesIO(data), charset, errors, decode_strings,
-                object_hook, array_hook)
+    unserializer = _PHPUnserializer(data, charset, errors, decode_strings,
+                                    object_hook, array_hook, object_hook_style)
+    return unserializer.load()
 
 
 def dump(
@@ -637,10 +948,11 @@ def dump(
 def dict_to_list(d: Union[Dict[int, T], Iterable[Tuple[int, T]]]) -> List[T]:
     """Converts an ordered dict into a list."""
     # make sure it's a dict, that way dict_to_list can be used as an
-    # array_hook.
-    d_dict = dict(d)
+    # array_hook.  Subclasses are copied too so that lookups can't hit
+    # a __missing__ that invents values.
+    d_dict = d if type(d) is dict else dict(d)
     try:
-        return [d_dict[x] for x in range(len(d_dict))]
+        return list(map(d_dict.__getitem__, range(len(d_dict))))
     except KeyError:
         raise ValueError('dict is not a sequence')
 
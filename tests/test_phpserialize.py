@@ -6,7 +6,7 @@ Based on original phpserialize tests
 import math
 import pytest
 from io import BytesIO
-from collections import OrderedDict
+from collections import OrderedDict, defaultdict
 from typing import Dict, List, Tuple, Union, Any, cast
 
 from phpserialize import (
@@ -60,6 +60,16 @@ class TestBasicSerialization:
         # With decode_strings, returns str
         assert loads(result, decode_strings=True) == text
 
+    def test_serialize_charset(self):
+        text = "Hello Wörld"
+        result = dumps(text, charset='cp1252')
+        assert b'W\xf6rld' in result
+        assert loads(result, charset='cp1252', decode_strings=True) == text
+        # the charset is only looked up once there is a string to decode
+        assert loads(b'i:1;', charset='unknown', decode_strings=True) == 1
+        with pytest.raises(LookupError):
+            loads(b's:8:"aGVsbG8=";', charset='base64', decode_strings=True)
+
 
 class TestCollectionSerialization:
     """Test serialization of lists, tuples, and dicts."""
@@ -91,6 +101,17 @@ class TestCollectionSerialization:
         loaded_decoded = loads(result, decode_strings=True)
         assert loaded_decoded == data
 
+    def test_decoded_keys_shared(self):
+        loaded = loads(dumps([{'name': 1}, {'name': 2}]), decode_strings=True)
+        first, second = (next(iter(d)) for d in loaded.values())
+        assert first == 'name'
+        assert first is second
+
+    def test_mixed_keys(self):
+        data: Dict[Union[int, str], Any] = {0: 'a', 'key': [1, 2], -1: None, 2: 1.5}
+        result = dumps(data)
+        assert loads(result, decode_strings=True) == {0: 'a', 'key': {0: 1, 1: 2}, -1: None, 2: 1.5}
+
     def test_nested_structures(self):
         data: Dict[str, Any] = {
             'users': [
@@ -129,6 +150,18 @@ class TestDictConversion:
         d = {0: 1, 1: 2, 2: 3}
         assert dict_to_tuple(d) == (1, 2, 3)
 
+    def test_dict_to_list_missing_hook(self):
+        d = defaultdict(int, {0: 1, 2: 3})
+        with pytest.raises(ValueError):
+            dict_to_list(d)
+        assert 1 not in d
+
+    def test_dict_to_list_as_array_hook(self):
+        result = loads(dumps([1, [2, 3]]), array_hook=dict_to_list)
+        assert result == [1, [2, 3]]
+        with pytest.raises(ValueError):
+            dict_to_tuple([(0, 'a'), (2, 'c')])
+
 
 class TestObjectSerialization:
     """Test PHP object serialization."""
@@ -148,6 +181,12 @@ class TestObjectSerialization:
         obj.new_attr = 'test'
         assert obj.new_attr == 'test'
 
+    def test_phpobject_member_precedence(self):
+        obj = phpobject('B', {' A secret': 'private', 'secret': 'public'})
+        assert obj.secret == 'private'
+        obj.secret = 'new'
+        assert obj.__php_vars__ == {' A secret': 'new', 'secret': 'public'}
+
     def test_phpobject_asdict(self):
         obj = phpobject('MyClass', {' * protected': 'value', 'public': 'data'})
         d = convert_member_dict(obj.__php_vars__)
@@ -196,6 +235,24 @@ class TestObjectSerialization:
         assert isinstance(user, User)
         assert user.username == 'admin'
 
+    def test_object_hook_items(self):
+        def items_hook(name: Union[str, bytes], items: List[Tuple[Union[str, int, bytes], Any]]) -> Any:
+            assert isinstance(items, list)
+            return name, items
+
+        data = b'O:7:"WP_User":2:{s:8:"username";s:5:"admin";s:2:"id";i:1;}'
+        result = loads(data, object_hook=items_hook, object_hook_style='items')
+        assert result == (b'WP_User', [(b'username', b'admin'), (b'id', 1)])
+
+        stream = BytesIO(data + b'N;')
+        assert load(stream, object_hook=items_hook, object_hook_style='items') == result
+        assert load(stream) is None
+
+    def test_object_hook_style_invalid(self):
+        data = b'O:7:"WP_User":1:{s:8:"username";s:5:"admin";}'
+        with pytest.raises(ValueError):
+            loads(data, object_hook=phpobject, object_hook_style=cast(Any, 'generator'))
+
 
 class TestMemberDict:
     """Test PHP member dict conversion."""
@@ -271,10 +328,49 @@ class TestFileIO:
         assert first == {0: 1, 1: 2}
         assert second == b'foo'
 
+    def test_chained_serialization_unseekable(self):
+        class Stream:
+            def __init__(self, data: bytes) -> None:
+                self.stream = BytesIO(data)
+
+            def read(self, n: int = -1) -> bytes:
+                return self.stream.read(n)
+
+        stream = BytesIO()
+        dump([1, 2], stream)
+        dump("foo", stream)
+
+        unseekable = Stream(stream.getvalue())
+        assert load(unseekable) == {0: 1, 1: 2}
+        assert load(unseekable) == b'foo'
+
+    def test_load_large_from_stream(self):
+        data = {i: 'x' * i for i in range(0, 5000, 7)}
+        stream = BytesIO()
+        dump(data, stream)
+        dump("foo", stream)
+
+        stream.seek(0)
+        assert load(stream, decode_strings=True) == data
+        assert load(stream) == b'foo'
+
 
 class TestEdgeCases:
     """Test edge cases and special scenarios."""
 
+    def test_deep_nesting(self):
+        depth = 400
+        data = b'a:1:{i:0;' * depth + b's:4:"leaf";' + b'}' * depth
+        result = loads(data)
+        for _ in range(depth):
+            result = result[0]
+        assert result == b'leaf'
+
+        nested: Any = 'leaf'
+        for _ in range(depth):
+            nested = [nested]
+        assert dumps(nested) == data
+
     def test_empty_string(self):
         result = dumps("")
         assert result == b's:0:"";'
@@ -310,6 +406,12 @@ class TestEdgeCases:
         assert loaded[3] == 'pi'
         assert loaded[2] == 'e'
 
+    def test_builtin_subclasses(self):
+        class Flag(int):
+            pass
+
+        assert dumps(OrderedDict([('a', Flag(1))])) == b'a:1:{s:1:"a";i:1;}'
+
 
 class TestErrorHandling:
     """Test error handling."""
@@ -322,6 +424,19 @@ class TestErrorHandling:
         with pytest.raises(ValueError):
             loads(b's:10:"short')
 
+    def test_invalid_input_type(self):
+        with pytest.raises(TypeError):
+            loads(cast(Any, 3))
+        with pytest.raises(TypeError):
+            loads(cast(Any, 'i:1;'))
+        assert loads(bytearray(b's:3:"foo";')) == b'foo'
+
+    def test_negative_length(self):
+        with pytest.raises(ValueError):
+            loads(b's:-1:";')
+        with pytest.raises(ValueError):
+            loads(b'O:-2:"X":0:{}', object_hook=phpobject)
+
     def test_object_without_hook(self):
         data = b'O:7:"WP_User":1:{s:8:"username";s:5:"admin";}'
         with pytest.raises(ValueError, match='object_hook not given'):